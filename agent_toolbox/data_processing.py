@@ -9,6 +9,10 @@ from pathlib import Path
 import re
 
 
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_SPECIAL_CHARS_PATTERN = re.compile(r'[^\w\s]')
+
+
 class DataProcessor:
     """Comprehensive data processing utilities for agents."""
     
@@ -27,10 +31,12 @@ class DataProcessor:
     def load_json_lines(self, file_path: Union[str, Path]) -> List[Dict[str, Any]]:
         """Load JSONL file."""
         data = []
-        with open(file_path, 'r') as f:
+        # JSON Lines is UTF-8 by definition; don't depend on the locale
+        with open(file_path, 'r', encoding='utf-8') as f:
             for line in f:
-                if line.strip():
-                    data.append(json.loads(line.strip()))
+                line = line.strip()
+                if line:
+                    data.append(json.loads(line))
         return data
         
     def save_json_lines(self, data: List[Dict[str, Any]], file_path: Union[str, Path]) -> None:
@@ -49,11 +55,11 @@ class DataProcessor:
             
         # Remove extra whitespace
         if remove_extra_whitespace:
-            text = re.sub(r'\s+', ' ', text.strip())
+            text = _WHITESPACE_PATTERN.sub(' ', text.strip())
             
         # Remove special characters
         if remove_special_chars:
-            text = re.sub(r'[^\w\s]', '', text)
+            text = _SPECIAL_CHARS_PATTERN.sub('', text)
             
         # Convert to lowercase
         if lowercase:
@@ -1,14 +1,23 @@
 """Caching utilities for agent tasks."""
 
+import os
+import sys
 import time
+import heapq
 import pickle
 import hashlib
 import json
 from pathlib import Path
-from typing import Any, Optional, Dict, Callable, Union
+from typing import Any, Optional, Dict, Callable, Union, List, Tuple, Iterable
 import functools
+import tempfile
 import threading
 
+# mkstemp creates files 0600; read the umask once (it can only be read by
+# setting it) so cache entries get the same mode as a plain open() would
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 
 class SimpleCache:
     """Simple in-memory cache with TTL support."""
@@ -18,70 +27,115 @@ class SimpleCache:
         self.default_ttl = default_ttl
         self._cache: Dict[str, Dict[str, Any]] = {}
         self._lock = threading.Lock()
+        self._size_bytes = 0
+        # Min-heap of (expires_at, key); stale pairs are skipped lazily
+        self._expiry: List[Tuple[float, str]] = []
         
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
         with self._lock:
-            if key not in self._cache:
+            entry = self._cache.get(key)
+            if entry is None:
                 return None
                 
-            entry = self._cache[key]
-            
             # Check if expired
-            if entry['expires_at'] < time.time():
+            if entry['expires_at'] < time.monotonic():
                 del self._cache[key]
+                self._size_bytes -= entry['size']
                 return None
                 
             return entry['value']
             
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Get several values under one lock; missing or expired keys are omitted."""
+        result = {}
+        
+        with self._lock:
+            now = time.monotonic()
+            for key in keys:
+                entry = self._cache.get(key)
+                if entry is None:
+                    continue
+                    
+                if entry['expires_at'] < now:
+                    del self._cache[key]
+                    self._size_bytes -= entry['size']
+                    continue
+                    
+                result[key] = entry['value']
+                
+        return result
+            
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Set value in cache with TTL."""
         if ttl is None:
             ttl = self.default_ttl
             
-        expires_at = time.time() + ttl
+        # Monotonic clock for TTLs so wall-clock jumps don't expire or revive entries
+        expires_at = time.monotonic() + ttl
+        # Shallow size, tracked incrementally so stats() stays O(1)
+        size = sys.getsizeof(key) + sys.getsizeof(value)
         
         with self._lock:
+            old_entry = self._cache.get(key)
+            if old_entry is not None:
+                self._size_bytes -= old_entry['size']
+                
             self._cache[key] = {
                 'value': value,
                 'expires_at': expires_at,
-                'created_at': time.time()
+                'created_at': time.time(),
+                'size': size
             }
+            self._size_bytes += size
+            
+            heapq.heappush(self._expiry, (expires_at, key))
+            # Rebuild from live entries once overwrites/deletes leave too many stale pairs
+            if len(self._expiry) > 2 * len(self._cache) + 64:
+                self._expiry = [(entry['expires_at'], k) for k, entry in self._cache.items()]
+                heapq.heapify(self._expiry)
             
     def delete(self, key: str) -> bool:
         """Delete key from cache."""
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                return True
-            return False
+            entry = self._cache.pop(key, None)
+            if entry is None:
+                return False
+            self._size_bytes -= entry['size']
+            return True
             
     def clear(self) -> None:
         """Clear all cache entries."""
         with self._lock:
             self._cache.clear()
+            self._size_bytes = 0
+            self._expiry.clear()
             
     def cleanup_expired(self) -> int:
         """Remove expired entries and return count removed."""
-        current_time = time.time()
-        expired_keys = []
+        current_time = time.monotonic()
+        removed_count = 0
         
         with self._lock:
-            for key, entry in self._cache.items():
-                if entry['expires_at'] < current_time:
-                    expired_keys.append(key)
-                    
-            for key in expired_keys:
+            # Only visit entries that are due instead of scanning the whole cache
+            while self._expiry and self._expiry[0][0] < current_time:
+                expires_at, key = heapq.heappop(self._expiry)
+                entry = self._cache.get(key)
+                # Skip pairs left behind by overwrites, deletes and lazy expiry in get()
+                if entry is None or entry['expires_at'] != expires_at:
+                    continue
                 del self._cache[key]
+                self._size_bytes -= entry['size']
+                removed_count += 1
                 
-        return len(expired_keys)
+        return removed_count
         
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         with self._lock:
             return {
                 'entries': len(self._cache),
-                'memory_usage_bytes': len(str(self._cache).encode('utf-8'))
+                'memory_usage_bytes': self._size_bytes
             }
 
 
@@ -96,8 +150,8 @@ class FileCache:
         
     def _get_cache_path(self, key: str) -> Path:
         """Get cache file path for key."""
-        # Create hash of key for filename
-        key_hash = hashlib.md5(key.encode()).hexdigest()
+        # Create hash of key for filename (non-cryptographic use)
+        key_hash = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
         return self.cache_dir / f"{key_hash}.cache"
         
     def get(self, key: str) -> Optional[Any]:
@@ -126,20 +180,28 @@ class FileCache:
             ttl = self.default_ttl
             
         cache_path = self._get_cache_path(key)
-        expires_at = time.time() + ttl
+        now = time.time()
         
         entry = {
             'key': key,
             'value': value,
-            'expires_at': expires_at,
-            'created_at': time.time()
+            'expires_at': now + ttl,
+            'created_at': now
         }
         
+        # Write to a temp file and rename so readers never see a partial entry
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
         try:
-            with open(cache_path, 'wb') as f:
-                pickle.dump(entry, f)
-        except pickle.PickleError:
-            pass  # Silently fail for unpicklable objects
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.chmod(tmp_name, 0o666 & ~_UMASK)
+            os.replace(tmp_name, cache_path)
+        except BaseException as e:
+            # Never leave temp files behind; clear() only globs *.cache
+            os.unlink(tmp_name)
+            # Silently fail for unpicklable objects
+            if not isinstance(e, (pickle.PickleError, TypeError, AttributeError)):
+                raise
             
     def delete(self, key: str) -> bool:
         """Delete key from cache."""
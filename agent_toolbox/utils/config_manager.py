@@ -2,20 +2,47 @@
 
 import os
 import json
+import functools
+import tempfile
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Union, Tuple
 from dotenv import load_dotenv
 
+# Use the libyaml C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+# Process umask, applied to JSON cache files since mkstemp always uses 0600
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dotted key into its parts, memoized for repeated lookups."""
+    return tuple(key.split('.'))
+
 
 class ConfigManager:
     """Manage configuration from files and environment variables."""
     
     def __init__(self, config_path: Optional[Union[str, Path]] = None, 
-                 load_env_file: bool = True):
-        """Initialize configuration manager."""
+                 load_env_file: bool = True, json_cache: bool = False):
+        """
+        Initialize configuration manager.
+        
+        Args:
+            config_path: Path to a JSON or YAML config file
+            load_env_file: Whether to load variables from a .env file
+            json_cache: Keep a parsed JSON copy next to YAML configs and
+                load from it while it is newer than the YAML source
+        """
         self.config = {}
         self.config_path = Path(config_path) if config_path else None
+        self.json_cache = json_cache
         
         if load_env_file:
             load_dotenv()
@@ -34,11 +61,65 @@ class ConfigManager:
             with open(self.config_path, 'r') as f:
                 self.config = json.load(f)
         elif file_extension in ['.yml', '.yaml']:
+            if self.json_cache and self._load_json_cache(self.config_path):
+                return
+                
             with open(self.config_path, 'r') as f:
-                self.config = yaml.safe_load(f)
+                self.config = yaml.load(f, Loader=_SafeLoader)
+                
+            if self.json_cache:
+                self._write_json_cache(self.config_path)
         else:
             raise ValueError(f"Unsupported config file type: {file_extension}")
             
+    @staticmethod
+    def _json_cache_path(yaml_path: Path) -> Path:
+        """Get JSON cache path for a YAML config file."""
+        return yaml_path.with_name(yaml_path.name + '.json')
+        
+    def _load_json_cache(self, yaml_path: Path) -> bool:
+        """Load config from the JSON cache if it is newer than the YAML source."""
+        cache_path = self._json_cache_path(yaml_path)
+        
+        # The cache is best-effort: missing, unreadable or corrupt files fall back to YAML
+        try:
+            if cache_path.stat().st_mtime_ns <= yaml_path.stat().st_mtime_ns:
+                return False
+            with open(cache_path, 'rb') as f:
+                self.config = json.load(f)
+            return True
+        except (OSError, ValueError):
+            return False
+            
+    def _write_json_cache(self, yaml_path: Path) -> None:
+        """Write parsed config as JSON next to its YAML source."""
+        cache_path = self._json_cache_path(yaml_path)
+        
+        try:
+            data = json.dumps(self.config)
+        except (TypeError, ValueError):
+            data = None
+            
+        # Failing to write the cache (e.g. read-only directory) must not fail the load
+        try:
+            # Skip configs JSON cannot represent faithfully (dates, non-string keys)
+            if data is None or json.loads(data) != self.config:
+                if cache_path.exists():
+                    cache_path.unlink()
+                return
+                
+            fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.write(data)
+                os.chmod(tmp_name, 0o666 & ~_UMASK)
+                os.replace(tmp_name, cache_path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError:
+            pass
+        
     def save_config(self, file_path: Optional[Union[str, Path]] = None) -> None:
         """Save configuration to file."""
         save_path = Path(file_path) if file_path else self.config_path
@@ -55,7 +136,10 @@ class ConfigManager:
                 json.dump(self.config, f, indent=2)
         elif file_extension in ['.yml', '.yaml']:
             with open(save_path, 'w') as f:
-                yaml.safe_dump(self.config, f, default_flow_style=False)
+                yaml.dump(self.config, f, Dumper=_SafeDumper, default_flow_style=False)
+                
+            if self.json_cache:
+                self._write_json_cache(save_path)
         else:
             raise ValueError(f"Unsupported config file type: {file_extension}")
             
@@ -77,7 +161,7 @@ class ConfigManager:
         
     def _get_nested_value(self, data: Dict[str, Any], key: str, default: Any) -> Any:
         """Get value from nested dictionary using dot notation."""
-        keys = key.split('.')
+        keys = _split_key(key)
         current = data
         
         try:
@@ -89,7 +173,7 @@ class ConfigManager:
             
     def _set_nested_value(self, data: Dict[str, Any], key: str, value: Any) -> None:
         """Set value in nested dictionary using dot notation."""
-        keys = key.split('.')
+        keys = _split_key(key)
         current = data
         
         for k in keys[:-1]:
@@ -109,11 +193,16 @@ class ConfigManager:
         
     def _deep_merge(self, target: Dict[str, Any], source: Dict[str, Any]) -> None:
         """Deep merge two dictionaries."""
-        for key, value in source.items():
-            if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-                self._deep_merge(target[key], value)
-            else:
-                target[key] = value
+        # Explicit stack instead of recursion: no frame per nesting level
+        stack = [(target, source)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    target[key] = value
                 
     def has_key(self, key: str) -> bool:
         """Check if configuration key exists."""
@@ -121,7 +210,7 @@ class ConfigManager:
         
     def delete_key(self, key: str) -> None:
         """Delete configuration key."""
-        keys = key.split('.')
+        keys = _split_key(key)
         current = self.config
         
         try:
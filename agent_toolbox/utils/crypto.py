@@ -7,6 +7,11 @@ import base64
 from typing import Union, Optional
 
 
+def _to_bytes(data: Union[str, bytes]) -> bytes:
+    """Encode str as UTF-8; pass bytes through unchanged."""
+    return data.encode('utf-8') if isinstance(data, str) else data
+
+
 def generate_random_string(length: int = 32, url_safe: bool = True) -> str:
     """Generate cryptographically secure random string."""
     if url_safe:
@@ -20,40 +25,47 @@ def generate_api_key(length: int = 32) -> str:
     return "atb_" + generate_random_string(length - 4, url_safe=True)
 
 
-def hash_string(text: str, algorithm: str = "sha256") -> str:
-    """Hash string using specified algorithm."""
+def hash_string(text: Union[str, bytes], algorithm: str = "sha256") -> str:
+    """Hash string or bytes using specified algorithm."""
     if algorithm not in hashlib.algorithms_available:
         raise ValueError(f"Algorithm {algorithm} not available")
         
-    hasher = hashlib.new(algorithm)
-    hasher.update(text.encode('utf-8'))
-    return hasher.hexdigest()
+    return hashlib.new(algorithm, _to_bytes(text)).hexdigest()
 
 
-def hash_file(file_path: str, algorithm: str = "sha256", chunk_size: int = 8192) -> str:
-    """Hash file contents using specified algorithm."""
+def hash_file(file_path: str, algorithm: str = "sha256", chunk_size: int = 1024 * 1024) -> str:
+    """
+    Hash file contents using specified algorithm.
+    
+    On Python 3.11+ hashing is delegated to hashlib.file_digest, which picks
+    its own buffer size; chunk_size is only used on older interpreters.
+    """
     if algorithm not in hashlib.algorithms_available:
         raise ValueError(f"Algorithm {algorithm} not available")
         
-    hasher = hashlib.new(algorithm)
-    
-    with open(file_path, 'rb') as f:
-        while chunk := f.read(chunk_size):
-            hasher.update(chunk)
+    with open(file_path, 'rb', buffering=0) as f:
+        # Python 3.11+ drives the read loop in C
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, algorithm).hexdigest()
+            
+        hasher = hashlib.new(algorithm)
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        while size := f.readinto(buffer):
+            hasher.update(view[:size])
             
     return hasher.hexdigest()
 
 
-def generate_hmac(message: str, key: str, algorithm: str = "sha256") -> str:
+def generate_hmac(message: Union[str, bytes], key: Union[str, bytes],
+                  algorithm: str = "sha256") -> str:
     """Generate HMAC for message using key."""
-    return hmac.new(
-        key.encode('utf-8'),
-        message.encode('utf-8'),
-        getattr(hashlib, algorithm)
-    ).hexdigest()
+    # One-shot digest avoids building an HMAC object per call
+    return hmac.digest(_to_bytes(key), _to_bytes(message), algorithm).hex()
 
 
-def verify_hmac(message: str, key: str, signature: str, algorithm: str = "sha256") -> bool:
+def verify_hmac(message: Union[str, bytes], key: Union[str, bytes], signature: str,
+                algorithm: str = "sha256") -> bool:
     """Verify HMAC signature."""
     expected = generate_hmac(message, key, algorithm)
     return hmac.compare_digest(expected, signature)
@@ -61,9 +73,7 @@ def verify_hmac(message: str, key: str, signature: str, algorithm: str = "sha256
 
 def encode_base64(data: Union[str, bytes]) -> str:
     """Encode data as base64 string."""
-    if isinstance(data, str):
-        data = data.encode('utf-8')
-    return base64.b64encode(data).decode('ascii')
+    return base64.b64encode(_to_bytes(data)).decode('ascii')
 
 
 def decode_base64(encoded: str) -> bytes:
@@ -73,15 +83,13 @@ def decode_base64(encoded: str) -> bytes:
 
 def encode_base64_url(data: Union[str, bytes]) -> str:
     """Encode data as URL-safe base64 string."""
-    if isinstance(data, str):
-        data = data.encode('utf-8')
-    return base64.urlsafe_b64encode(data).decode('ascii').rstrip('=')
+    # Strip padding while still bytes so only one str is created
+    return base64.urlsafe_b64encode(_to_bytes(data)).rstrip(b'=').decode('ascii')
 
 
-def decode_base64_url(encoded: str) -> bytes:
+def decode_base64_url(encoded: Union[str, bytes]) -> bytes:
     """Decode URL-safe base64 string to bytes."""
-    # Add padding if needed
-    padding = 4 - (len(encoded) % 4)
-    if padding != 4:
-        encoded += '=' * padding
-    return base64.urlsafe_b64decode(encoded)
\ No newline at end of file
+    if isinstance(encoded, str):
+        encoded = encoded.encode('ascii')
+    # Restore padding: (-len) & 3 is the number of '=' needed
+    return base64.urlsafe_b64decode(encoded + b'=' * (-len(encoded) & 3))
\ No newline at end of file
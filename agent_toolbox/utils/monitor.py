@@ -3,7 +3,9 @@
 import time
 import psutil
 import threading
-from typing import Dict, Any, Optional, Callable, List
+import numpy as np
+from collections import deque
+from typing import Dict, Any, Optional, Callable, Deque
 from .logger import Logger
 
 
@@ -63,12 +65,26 @@ class SystemMonitor:
         }
 
 
+def _summarize_timings(timings: Deque[float]) -> Dict[str, float]:
+    """Compute summary statistics for a non-empty series of timings."""
+    # One contiguous array; np.median selects via partition rather than a full sort
+    values = np.fromiter(timings, dtype=np.float64, count=len(timings))
+    return {
+        "count": len(values),
+        "min": float(values.min()),
+        "max": float(values.max()),
+        "mean": float(values.mean()),
+        "median": float(np.median(values)),
+        "std_dev": float(values.std(ddof=1)) if len(values) > 1 else 0.0
+    }
+
+
 class PerformanceMonitor:
     """Monitor application performance and timing."""
     
     def __init__(self):
         """Initialize performance monitor."""
-        self.metrics: Dict[str, List[float]] = {}
+        self.metrics: Dict[str, Deque[float]] = {}
         self.counters: Dict[str, int] = {}
         self.lock = threading.Lock()
         
@@ -79,14 +95,15 @@ class PerformanceMonitor:
         def decorator(func: Callable) -> Callable:
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
-                start_time = time.time()
+                # perf_counter: high-resolution and unaffected by clock changes
+                start_time = time.perf_counter()
                 try:
                     result = func(*args, **kwargs)
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     self.record_timing(func_name, duration)
                     return result
                 except Exception as e:
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     self.record_timing(f"{func_name}_error", duration)
                     raise
             return wrapper
@@ -95,13 +112,11 @@ class PerformanceMonitor:
     def record_timing(self, metric_name: str, duration: float) -> None:
         """Record timing metric."""
         with self.lock:
-            if metric_name not in self.metrics:
-                self.metrics[metric_name] = []
-            self.metrics[metric_name].append(duration)
-            
-            # Keep only last 1000 measurements
-            if len(self.metrics[metric_name]) > 1000:
-                self.metrics[metric_name] = self.metrics[metric_name][-1000:]
+            timings = self.metrics.get(metric_name)
+            if timings is None:
+                # Keep only last 1000 measurements
+                timings = self.metrics[metric_name] = deque(maxlen=1000)
+            timings.append(duration)
                 
     def increment_counter(self, counter_name: str, value: int = 1) -> None:
         """Increment a counter."""
@@ -118,15 +133,7 @@ class PerformanceMonitor:
             if not timings:
                 return None
                 
-            import statistics
-            return {
-                "count": len(timings),
-                "min": min(timings),
-                "max": max(timings),
-                "mean": statistics.mean(timings),
-                "median": statistics.median(timings),
-                "std_dev": statistics.stdev(timings) if len(timings) > 1 else 0.0
-            }
+            return _summarize_timings(timings)
             
     def get_all_stats(self) -> Dict[str, Any]:
         """Get all performance statistics."""
@@ -136,10 +143,10 @@ class PerformanceMonitor:
                 "counters": self.counters.copy()
             }
             
-            for metric_name in self.metrics.keys():
-                timing_stats = self.get_timing_stats(metric_name)
-                if timing_stats:
-                    stats["timings"][metric_name] = timing_stats
+            # Summarize in one pass; get_timing_stats would re-acquire self.lock
+            for metric_name, timings in self.metrics.items():
+                if timings:
+                    stats["timings"][metric_name] = _summarize_timings(timings)
                     
             return stats
             
@@ -23,8 +23,19 @@ class RateLimiter:
         self.time_window = time_window
         self.burst_capacity = burst_capacity or max_calls
         self.tokens = float(self.burst_capacity)
-        self.last_update = time.time()
+        self.last_update = time.monotonic()
         self.lock = threading.Lock()
+        # Set by MultiKeyRateLimiter when an idle sweep drops this limiter
+        self._retired = False
+        
+    def _refill(self, current_time: float) -> None:
+        """Add tokens generated since the last update; caller holds lock."""
+        elapsed = current_time - self.last_update
+        self.tokens = min(
+            self.burst_capacity,
+            self.tokens + (elapsed * self.max_calls / self.time_window)
+        )
+        self.last_update = current_time
         
     def acquire(self, tokens: int = 1, blocking: bool = True, timeout: Optional[float] = None) -> bool:
         """
@@ -38,46 +49,37 @@ class RateLimiter:
         Returns:
             True if tokens acquired, False otherwise
         """
-        start_time = time.time()
+        # A request larger than the bucket could never be satisfied
+        if not 0 <= tokens <= self.burst_capacity:
+            raise ValueError(f"tokens must be between 0 and {self.burst_capacity}, got {tokens}")
+            
+        start_time = time.monotonic()
         
         while True:
             with self.lock:
-                current_time = time.time()
-                
-                # Add tokens based on elapsed time
-                elapsed = current_time - self.last_update
-                self.tokens = min(
-                    self.burst_capacity,
-                    self.tokens + (elapsed * self.max_calls / self.time_window)
-                )
-                self.last_update = current_time
+                self._refill(time.monotonic())
                 
                 # Check if we have enough tokens
                 if self.tokens >= tokens:
                     self.tokens -= tokens
                     return True
                     
+                tokens_needed = tokens - self.tokens
+                
             if not blocking:
                 return False
                 
-            if timeout and (time.time() - start_time) >= timeout:
+            if timeout and (time.monotonic() - start_time) >= timeout:
                 return False
                 
             # Calculate sleep time based on token generation rate
-            tokens_needed = tokens - self.tokens
             sleep_time = min(0.1, tokens_needed * self.time_window / self.max_calls)
             time.sleep(sleep_time)
             
     def get_tokens_available(self) -> int:
         """Get number of tokens currently available."""
         with self.lock:
-            current_time = time.time()
-            elapsed = current_time - self.last_update
-            self.tokens = min(
-                self.burst_capacity,
-                self.tokens + (elapsed * self.max_calls / self.time_window)
-            )
-            self.last_update = current_time
+            self._refill(time.monotonic())
             return int(self.tokens)
             
     def __enter__(self):
@@ -105,37 +107,47 @@ class SlidingWindowRateLimiter:
         self.time_window = time_window
         self.calls = deque()
         self.lock = threading.Lock()
+        self._retired = False
         
-    def acquire(self, blocking: bool = True, timeout: Optional[float] = None) -> bool:
+    def acquire(self, blocking: bool = True, timeout: Optional[float] = None,
+                tokens: int = 1) -> bool:
         """
         Acquire permission to make a call.
         
         Args:
             blocking: Whether to block if rate limit exceeded
             timeout: Maximum time to wait (when blocking)
+            tokens: Number of calls to admit at once
             
         Returns:
             True if call allowed, False otherwise
         """
-        start_time = time.time()
+        # A request larger than the window could never be admitted
+        if not 0 <= tokens <= self.max_calls:
+            raise ValueError(f"tokens must be between 0 and {self.max_calls}, got {tokens}")
+            
+        start_time = time.monotonic()
         
         while True:
             with self.lock:
-                current_time = time.time()
+                current_time = time.monotonic()
                 
                 # Remove old calls outside the time window
                 while self.calls and current_time - self.calls[0] > self.time_window:
                     self.calls.popleft()
                     
-                # Check if we can make the call
-                if len(self.calls) < self.max_calls:
-                    self.calls.append(current_time)
+                # Check if we can make the call(s)
+                if len(self.calls) + tokens <= self.max_calls:
+                    if tokens == 1:
+                        self.calls.append(current_time)
+                    else:
+                        self.calls.extend([current_time] * tokens)
                     return True
                     
             if not blocking:
                 return False
                 
-            if timeout and (time.time() - start_time) >= timeout:
+            if timeout and (time.monotonic() - start_time) >= timeout:
                 return False
                 
             # Sleep until the oldest call expires
@@ -148,13 +160,83 @@ class SlidingWindowRateLimiter:
     def get_calls_remaining(self) -> int:
         """Get number of calls remaining in current window."""
         with self.lock:
-            current_time = time.time()
+            current_time = time.monotonic()
             # Remove old calls
             while self.calls and current_time - self.calls[0] > self.time_window:
                 self.calls.popleft()
             return max(0, self.max_calls - len(self.calls))
 
 
+class FixedWindowRateLimiter:
+    """Rate limiter using fixed window counter algorithm."""
+    
+    def __init__(self, max_calls: int, time_window: float):
+        """
+        Initialize fixed window rate limiter.
+        
+        Args:
+            max_calls: Maximum number of calls allowed per window
+            time_window: Window length in seconds
+        """
+        self.max_calls = max_calls
+        self.time_window = time_window
+        self.count = 0
+        self.window_start = time.monotonic()
+        self.lock = threading.Lock()
+        self._retired = False
+        
+    def _roll_window(self, current_time: float) -> None:
+        """Start a new window if the current one has elapsed; caller holds lock."""
+        if current_time - self.window_start >= self.time_window:
+            self.count = 0
+            self.window_start = current_time
+            
+    def acquire(self, blocking: bool = True, timeout: Optional[float] = None,
+                tokens: int = 1) -> bool:
+        """
+        Acquire permission to make a call.
+        
+        Args:
+            blocking: Whether to block if rate limit exceeded
+            timeout: Maximum time to wait (when blocking)
+            tokens: Number of calls to admit at once
+            
+        Returns:
+            True if call allowed, False otherwise
+        """
+        # A request larger than the window could never be admitted
+        if not 0 <= tokens <= self.max_calls:
+            raise ValueError(f"tokens must be between 0 and {self.max_calls}, got {tokens}")
+            
+        start_time = time.monotonic()
+        
+        while True:
+            with self.lock:
+                current_time = time.monotonic()
+                self._roll_window(current_time)
+                
+                if self.count + tokens <= self.max_calls:
+                    self.count += tokens
+                    return True
+                    
+                window_end = self.window_start + self.time_window
+                
+            if not blocking:
+                return False
+                
+            if timeout and (time.monotonic() - start_time) >= timeout:
+                return False
+                
+            # Sleep until the current window closes
+            time.sleep(max(0.01, min(0.1, window_end - current_time)))
+            
+    def get_calls_remaining(self) -> int:
+        """Get number of calls remaining in current window."""
+        with self.lock:
+            self._roll_window(time.monotonic())
+            return max(0, self.max_calls - self.count)
+
+
 class MultiKeyRateLimiter:
     """Rate limiter with separate limits for different keys."""
     
@@ -165,15 +247,17 @@ class MultiKeyRateLimiter:
         Args:
             max_calls: Maximum calls per key
             time_window: Time window in seconds
-            limiter_type: 'token_bucket' or 'sliding_window'
+            limiter_type: 'token_bucket', 'sliding_window' or 'fixed_window'
         """
         self.max_calls = max_calls
         self.time_window = time_window
         self.limiter_type = limiter_type
         self.limiters: Dict[str, Any] = {}
         self.lock = threading.Lock()
+        self._next_cleanup = time.monotonic() + time_window
         
-    def acquire(self, key: str, blocking: bool = True, timeout: Optional[float] = None) -> bool:
+    def acquire(self, key: str, blocking: bool = True, timeout: Optional[float] = None,
+                tokens: int = 1) -> bool:
         """
         Acquire permission for specific key.
         
@@ -181,26 +265,87 @@ class MultiKeyRateLimiter:
             key: Identifier for rate limit bucket
             blocking: Whether to block if rate limit exceeded
             timeout: Maximum time to wait
+            tokens: Number of calls to admit at once
             
         Returns:
             True if call allowed, False otherwise
         """
+        # Validate before creating a per-key limiter for a doomed request
+        if not 0 <= tokens <= self.max_calls:
+            raise ValueError(f"tokens must be between 0 and {self.max_calls}, got {tokens}")
+            
+        while True:
+            # Each limiter has its own lock; only registry inserts need self.lock
+            limiter = self.limiters.get(key)
+            if limiter is None:
+                limiter = self._get_or_create(key)
+                
+            allowed = limiter.acquire(tokens=tokens, blocking=blocking, timeout=timeout)
+            
+            # A sweep may have retired this limiter between lookup and acquire;
+            # its calls would not count against the key, so charge the live one
+            if not limiter._retired:
+                return allowed
+                
+    def _get_or_create(self, key: str) -> Any:
+        """Get the limiter for key, creating it under self.lock if missing."""
         with self.lock:
-            if key not in self.limiters:
+            limiter = self.limiters.get(key)
+            if limiter is None:
+                # New keys are what grow the registry, so sweep here
+                now = time.monotonic()
+                if now >= self._next_cleanup:
+                    self._remove_idle(now)
+                    
                 if self.limiter_type == 'sliding_window':
-                    self.limiters[key] = SlidingWindowRateLimiter(self.max_calls, self.time_window)
+                    limiter = SlidingWindowRateLimiter(self.max_calls, self.time_window)
+                elif self.limiter_type == 'fixed_window':
+                    limiter = FixedWindowRateLimiter(self.max_calls, self.time_window)
                 else:
-                    self.limiters[key] = RateLimiter(self.max_calls, self.time_window)
-                    
-        return self.limiters[key].acquire(blocking=blocking, timeout=timeout)
+                    limiter = RateLimiter(self.max_calls, self.time_window)
+                self.limiters[key] = limiter
+                
+            return limiter
+        
+    def cleanup_idle(self) -> int:
+        """Remove limiters back at full capacity and return count removed."""
+        with self.lock:
+            return self._remove_idle(time.monotonic())
+            
+    def _remove_idle(self, now: float) -> int:
+        """Drop idle limiters; caller must hold self.lock."""
+        # An idle limiter behaves exactly like a freshly created one
+        idle_keys = [key for key, limiter in self.limiters.items()
+                     if self._retire_if_idle(limiter, now)]
+        for key in idle_keys:
+            del self.limiters[key]
+            
+        self._next_cleanup = now + self.time_window
+        return len(idle_keys)
+        
+    @staticmethod
+    def _retire_if_idle(limiter: Any, now: float) -> bool:
+        """Mark a fully recovered limiter as retired and report whether it was."""
+        with limiter.lock:
+            if isinstance(limiter, SlidingWindowRateLimiter):
+                idle = not limiter.calls or now - limiter.calls[-1] > limiter.time_window
+            elif isinstance(limiter, FixedWindowRateLimiter):
+                idle = limiter.count == 0 or now - limiter.window_start >= limiter.time_window
+            else:
+                refill = (now - limiter.last_update) * limiter.max_calls / limiter.time_window
+                idle = limiter.tokens + refill >= limiter.burst_capacity
+                
+            # Set under the limiter lock so any later acquire on it sees the flag
+            limiter._retired = idle
+            return idle
         
     def get_stats(self, key: str) -> Dict[str, Any]:
         """Get rate limiter stats for a key."""
-        if key not in self.limiters:
+        limiter = self.limiters.get(key)
+        if limiter is None:
             return {'calls_remaining': self.max_calls}
             
-        limiter = self.limiters[key]
-        if isinstance(limiter, SlidingWindowRateLimiter):
+        if isinstance(limiter, (SlidingWindowRateLimiter, FixedWindowRateLimiter)):
             return {'calls_remaining': limiter.get_calls_remaining()}
         else:
             return {'tokens_available': limiter.get_tokens_available()}
@@ -220,18 +365,23 @@ def rate_limited(max_calls: int, time_window: float, key_func: Optional[Callable
     else:
         limiter = RateLimiter(max_calls, time_window)
         
+    acquire = limiter.acquire
+    
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            if key_func:
+        # Pick the wrapper once at decoration time rather than per call
+        if key_func:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
                 key = key_func(*args, **kwargs)
-                if not limiter.acquire(key):
+                if not acquire(key):
                     raise Exception(f"Rate limit exceeded for key: {key}")
-            else:
-                if not limiter.acquire():
+                return func(*args, **kwargs)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not acquire():
                     raise Exception("Rate limit exceeded")
-                    
-            return func(*args, **kwargs)
+                return func(*args, **kwargs)
             
         wrapper._rate_limiter = limiter  # Expose limiter for inspection
         return wrapper
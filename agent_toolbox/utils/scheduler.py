@@ -1,9 +1,10 @@
 """Simple task scheduler for periodic and delayed execution."""
 
 import time
+import queue
 import threading
 from datetime import datetime, timedelta
-from typing import Callable, Any, Optional, Dict, List
+from typing import Callable, Any, Optional, Dict, List, Set
 from .logger import Logger
 
 
@@ -47,12 +48,23 @@ class ScheduledTask:
 class SimpleScheduler:
     """Simple task scheduler."""
     
-    def __init__(self):
-        """Initialize scheduler."""
+    def __init__(self, max_workers: int = 0):
+        """
+        Initialize scheduler.
+        
+        Args:
+            max_workers: Number of daemon worker threads that run due tasks.
+                With 0, tasks run one after another on the scheduler thread,
+                so a slow task delays every other task.
+        """
         self.tasks: Dict[str, ScheduledTask] = {}
         self.running = False
         self.scheduler_thread: Optional[threading.Thread] = None
         self.logger = Logger("SimpleScheduler")
+        self.max_workers = max_workers
+        self._work_queue: "queue.SimpleQueue[Optional[ScheduledTask]]" = queue.SimpleQueue()
+        self._queued: Set[str] = set()
+        self._workers: List[threading.Thread] = []
         
     def add_task(self, func: Callable, interval: float,
                  args: tuple = (), kwargs: dict = None,
@@ -96,6 +108,20 @@ class SimpleScheduler:
             return
             
         self.running = True
+        
+        # Workers are daemons (unlike ThreadPoolExecutor's) so a blocked
+        # task never holds up interpreter exit. Each start gets a fresh
+        # queue so workers left over from a timed-out stop() can't pick up
+        # new work.
+        self._work_queue = queue.SimpleQueue()
+        self._queued = set()
+        self._workers = []
+        for _ in range(self.max_workers):
+            worker = threading.Thread(target=self._run_worker,
+                                      args=(self._work_queue,), daemon=True)
+            worker.start()
+            self._workers.append(worker)
+            
         self.scheduler_thread = threading.Thread(target=self._run_scheduler, daemon=True)
         self.scheduler_thread.start()
         self.logger.info("Scheduler started")
@@ -105,6 +131,14 @@ class SimpleScheduler:
         self.running = False
         if self.scheduler_thread and self.scheduler_thread.is_alive():
             self.scheduler_thread.join(timeout=5)
+            
+        # One sentinel per worker, queued behind any pending tasks
+        for _ in self._workers:
+            self._work_queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout=5)
+        self._workers = []
+        
         self.logger.info("Scheduler stopped")
         
     def _run_scheduler(self) -> None:
@@ -112,24 +146,61 @@ class SimpleScheduler:
         while self.running:
             current_time = time.time()
             
-            # Check which tasks need to run
-            for task in self.tasks.values():
-                if task.should_run():
-                    try:
-                        task.run()
-                    except Exception as e:
-                        self.logger.error(f"Task {task.task_id} failed: {e}")
+            # Check which tasks need to run (snapshot, tasks may be added
+            # from other threads while the loop is running)
+            for task in list(self.tasks.values()):
+                if not task.should_run():
+                    continue
+                    
+                if self._workers:
+                    # Skip tasks whose previous run is still queued or running
+                    if task.task_id not in self._queued:
+                        self._queued.add(task.task_id)
+                        self._work_queue.put(task)
+                else:
+                    self._run_task(task)
                         
             time.sleep(0.1)  # Small sleep to prevent busy waiting
+            
+    def _run_worker(self, work_queue: "queue.SimpleQueue[Optional[ScheduledTask]]") -> None:
+        """Worker loop running tasks handed over by the scheduler until stopped."""
+        while True:
+            task = work_queue.get()
+            if task is None:
+                return
+                
+            try:
+                # Drop tasks that were still queued when stop() was called
+                if self.running and work_queue is self._work_queue:
+                    self._run_task(task)
+            finally:
+                self._queued.discard(task.task_id)
+                
+    def _run_task(self, task: ScheduledTask) -> None:
+        """Run a task, logging instead of raising on failure."""
+        try:
+            task.run()
+        except Exception as e:
+            self.logger.error(f"Task {task.task_id} failed: {e}")
+
+
+# Shared scheduler so decorated functions don't each get their own thread.
+# Due tasks run on a few workers: a slow task only delays the others once
+# every worker is busy.
+_default_scheduler = SimpleScheduler(max_workers=4)
 
 
 # Convenience functions for common scheduling patterns
 def schedule_every(seconds: float):
-    """Decorator to schedule function every N seconds."""
+    """
+    Decorator to schedule function every N seconds.
+    
+    Functions share one scheduler thread and a pool of 4 workers, so more
+    than 4 simultaneously blocked functions delay the rest.
+    """
     def decorator(func: Callable) -> Callable:
-        scheduler = SimpleScheduler()
-        scheduler.add_task(func, seconds)
-        scheduler.start()
+        _default_scheduler.add_task(func, seconds)
+        _default_scheduler.start()
         return func
     return decorator
 
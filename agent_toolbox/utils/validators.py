@@ -7,6 +7,12 @@ from urllib.parse import urlparse
 import email.utils
 
 
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_STRIP_PATTERN = re.compile(r'[^\d+]')
+_US_PHONE_PATTERN = re.compile(r'^(\+?1)?[0-9]{10}$')
+_INTL_PHONE_PATTERN = re.compile(r'^\+[1-9][0-9]{6,14}$')
+
+
 def validate_email(email_addr: str) -> bool:
     """Validate email address format."""
     try:
@@ -16,8 +22,7 @@ def validate_email(email_addr: str) -> bool:
             return False
             
         # Additional regex validation
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, parsed[1]) is not None
+        return _EMAIL_PATTERN.match(parsed[1]) is not None
     except:
         return False
 
@@ -52,17 +57,17 @@ def validate_ip_address(ip: str, version: Optional[int] = None) -> bool:
 def validate_phone(phone: str, country_code: Optional[str] = None) -> bool:
     """Validate phone number format (basic validation)."""
     # Remove common formatting
-    cleaned = re.sub(r'[^\d+]', '', phone)
+    cleaned = _PHONE_STRIP_PATTERN.sub('', phone)
     
     # Basic validation patterns
     if country_code == 'US':
         # US phone number: +1XXXXXXXXXX or 1XXXXXXXXXX or XXXXXXXXXX
-        pattern = r'^(\+?1)?[0-9]{10}$'
+        pattern = _US_PHONE_PATTERN
     else:
         # International: must start with + and have 7-15 digits
-        pattern = r'^\+[1-9][0-9]{6,14}$'
+        pattern = _INTL_PHONE_PATTERN
         
-    return re.match(pattern, cleaned) is not None
+    return pattern.match(cleaned) is not None
 
 
 def validate_json(json_str: str) -> bool:
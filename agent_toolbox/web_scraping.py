@@ -2,12 +2,20 @@
 
 import re
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
 from urllib.parse import urljoin, urlparse
 from typing import Dict, List, Optional, Union, Any
 import time
 
 
+# Extractors that only need one family of tags build just those subtrees
+_LINK_STRAINER = SoupStrainer('a', href=True)
+_IMAGE_STRAINER = SoupStrainer('img')
+_TABLE_STRAINER = SoupStrainer('table')
+_METADATA_STRAINER = SoupStrainer(['title', 'meta'])
+
+
 class WebScraper:
     """Comprehensive web scraping utilities for agents.
     
@@ -33,13 +41,17 @@ class WebScraper:
     def __init__(self, 
                  user_agent: str = "Agent-Toolbox/1.0",
                  timeout: int = 30,
-                 delay: float = 1.0) -> None:
+                 delay: float = 1.0,
+                 pool_connections: int = 20,
+                 pool_maxsize: int = 20) -> None:
         """Initialize WebScraper with configuration.
         
         Args:
             user_agent: User-Agent string to identify your scraper
             timeout: Request timeout in seconds
             delay: Minimum delay between requests in seconds (rate limiting)
+            pool_connections: Number of per-host connection pools to keep alive
+            pool_maxsize: Maximum number of connections kept per host
             
         Note:
             The default delay of 1.0 seconds is respectful to most servers.
@@ -51,6 +63,12 @@ class WebScraper:
         self.session = requests.Session()
         self.session.headers.update({'User-Agent': user_agent})
         
+        # Reuse keep-alive connections across scrapes instead of paying a
+        # fresh TCP/TLS handshake whenever more than a few hosts are visited
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
     def get_page(self, url: str, **kwargs) -> requests.Response:
         """Get a web page with comprehensive error handling and rate limiting.
         
@@ -86,10 +104,30 @@ class WebScraper:
         except requests.RequestException as e:
             raise Exception(f"Failed to fetch {url}: {str(e)}")
             
+    def _parse_html(self, response: requests.Response,
+                    parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Parse a response body into a BeautifulSoup tree.
+        
+        Uses the C-backed lxml parser, falling back to the pure-Python
+        html.parser if lxml is unavailable. A charset declared in the
+        Content-Type header is passed through so BeautifulSoup can skip
+        encoding detection. When parse_only is given, only the matching
+        subtrees are built.
+        """
+        content_type = response.headers.get('Content-Type', '').lower()
+        encoding = response.encoding if 'charset=' in content_type else None
+        
+        try:
+            return BeautifulSoup(response.content, 'lxml',
+                                 from_encoding=encoding, parse_only=parse_only)
+        except FeatureNotFound:
+            return BeautifulSoup(response.content, 'html.parser',
+                                 from_encoding=encoding, parse_only=parse_only)
+            
     def extract_text(self, url: str, clean: bool = True) -> str:
         """Extract all text content from a webpage."""
         response = self.get_page(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = self._parse_html(response)
         
         if clean:
             # Remove script and style elements
@@ -109,7 +147,7 @@ class WebScraper:
     def extract_links(self, url: str, absolute: bool = True) -> List[Dict[str, str]]:
         """Extract all links from a webpage."""
         response = self.get_page(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = self._parse_html(response, parse_only=_LINK_STRAINER)
         
         links = []
         for link in soup.find_all('a', href=True):
@@ -128,7 +166,7 @@ class WebScraper:
     def extract_images(self, url: str, absolute: bool = True) -> List[Dict[str, str]]:
         """Extract all images from a webpage."""
         response = self.get_page(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = self._parse_html(response, parse_only=_IMAGE_STRAINER)
         
         images = []
         for img in soup.find_all('img'):
@@ -149,7 +187,7 @@ class WebScraper:
     def extract_by_selector(self, url: str, selector: str) -> List[Dict[str, str]]:
         """Extract elements using CSS selectors."""
         response = self.get_page(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = self._parse_html(response)
         
         elements = []
         for element in soup.select(selector):
@@ -165,7 +203,7 @@ class WebScraper:
     def extract_tables(self, url: str) -> List[List[List[str]]]:
         """Extract all tables as nested lists."""
         response = self.get_page(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = self._parse_html(response, parse_only=_TABLE_STRAINER)
         
         tables = []
         for table in soup.find_all('table'):
@@ -182,7 +220,7 @@ class WebScraper:
     def extract_metadata(self, url: str) -> Dict[str, str]:
         """Extract page metadata (title, description, etc.)."""
         response = self.get_page(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = self._parse_html(response, parse_only=_METADATA_STRAINER)
         
         metadata = {
             'title': '',
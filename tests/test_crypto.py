@@ -138,6 +138,38 @@ class TestCryptoUtils:
         assert verify_hmac(key, message, signature_sha1, algorithm='sha1') is True
         assert signature != signature_sha1  # Different algorithms produce different signatures
     
+    def test_bytes_input(self):
+        """Test bytes input matches the equivalent str input."""
+        text = "Héllo, World!"
+        data = text.encode('utf-8')
+        
+        assert hash_string(data) == hash_string(text)
+        assert hash_string(data, algorithm='md5') == hash_string(text, algorithm='md5')
+        
+        signature = generate_hmac(text, "secret_key")
+        assert generate_hmac(data, b"secret_key") == signature
+        assert verify_hmac(data, b"secret_key", signature) is True
+        assert verify_hmac(text, b"secret_key", signature) is True
+    
+    @pytest.mark.skipif('sha512_256' not in hashlib.algorithms_available,
+                        reason="OpenSSL build lacks sha512_256")
+    def test_hmac_digest_name(self):
+        """Test HMAC with a digest only reachable by name, not as a hashlib attribute."""
+        assert not hasattr(hashlib, 'sha512_256')
+        
+        signature = generate_hmac("message", "key", algorithm='sha512_256')
+        expected = hmac.new(b"key", b"message", 'sha512_256').hexdigest()
+        assert signature == expected
+        assert verify_hmac("message", "key", signature, algorithm='sha512_256') is True
+    
+    def test_unknown_algorithm(self):
+        """Test unknown algorithms raise ValueError."""
+        with pytest.raises(ValueError):
+            hash_string("text", algorithm='not_a_hash')
+            
+        with pytest.raises(ValueError):
+            generate_hmac("message", "key", algorithm='not_a_hash')
+    
     def test_base64_operations(self):
         """Test Base64 encoding and decoding."""
         test_data = "Hello, Base64 encoding!"
@@ -1,11 +1,23 @@
 """Tests for utility modules."""
 
+import os
 import pytest
 import time
 import tempfile
+import threading
 import json
 from pathlib import Path
-from agent_toolbox.utils import ConfigManager, Logger, retry, RateLimiter
+from agent_toolbox.utils import (
+    ConfigManager, Logger, retry, RateLimiter, SimpleCache, FileCache,
+    PerformanceMonitor, SimpleScheduler, schedule_every
+)
+from agent_toolbox.utils import cache as cache_module
+from agent_toolbox.utils import config_manager as config_manager_module
+from agent_toolbox.utils import rate_limiter as rate_limiter_module
+from agent_toolbox.utils import scheduler as scheduler_module
+from agent_toolbox.utils.rate_limiter import (
+    FixedWindowRateLimiter, MultiKeyRateLimiter, SlidingWindowRateLimiter
+)
 
 
 class TestConfigManager:
@@ -114,6 +126,92 @@ class TestConfigManager:
             
         finally:
             Path(config_file).unlink()
+            
+    def test_yaml_json_cache_failures(self, monkeypatch):
+        """Test JSON cache problems fall back to the YAML source."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_file = Path(temp_dir) / 'config.yaml'
+            cache_file = Path(temp_dir) / 'config.yaml.json'
+            config_file.write_text('name: agent\n')
+            
+            # A corrupt cache newer than the YAML is ignored and rewritten
+            cache_file.write_text('{not json')
+            stat = config_file.stat()
+            os.utime(cache_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            assert ConfigManager(config_file, json_cache=True).get('name') == 'agent'
+            assert json.loads(cache_file.read_text()) == {'name': 'agent'}
+            
+            # An unwritable cache location does not break loading
+            cache_file.unlink()
+            
+            def read_only(*args, **kwargs):
+                raise PermissionError("read-only directory")
+                
+            monkeypatch.setattr(tempfile, 'mkstemp', read_only)
+            assert ConfigManager(config_file, json_cache=True).get('name') == 'agent'
+            assert not cache_file.exists()
+            
+            # Temp files are removed when the write itself fails
+            monkeypatch.undo()
+            monkeypatch.setattr(os, 'replace', read_only)
+            assert ConfigManager(config_file, json_cache=True).get('name') == 'agent'
+            assert sorted(p.name for p in Path(temp_dir).iterdir()) == ['config.yaml']
+            
+    def test_yaml_file_operations(self):
+        """Test YAML save/load round trip."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_file = Path(temp_dir) / 'config.yaml'
+            
+            config = ConfigManager()
+            config.set('server.ports', [8080, 8081])
+            config.set('server.name', 'agent')
+            config.save_config(config_file)
+            
+            loaded_config = ConfigManager(config_file)
+            
+            assert loaded_config.get('server.ports') == [8080, 8081]
+            assert loaded_config.get('server.name') == 'agent'
+            
+    def test_yaml_json_cache(self):
+        """Test YAML configs load from a fresher JSON cache."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_file = Path(temp_dir) / 'config.yaml'
+            cache_file = Path(temp_dir) / 'config.yaml.json'
+            config_file.write_text('server:\n  name: agent\n')
+            
+            config = ConfigManager(config_file, json_cache=True)
+            assert config.get('server.name') == 'agent'
+            assert json.loads(cache_file.read_text()) == {'server': {'name': 'agent'}}
+            
+            # The cache is preferred while it is newer than the YAML
+            cache_file.write_text(json.dumps({'server': {'name': 'cached'}}))
+            assert ConfigManager(config_file, json_cache=True).get('server.name') == 'cached'
+            
+            # Editing the YAML invalidates the cache
+            config_file.write_text('server:\n  name: edited\n')
+            stat = cache_file.stat()
+            os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            assert ConfigManager(config_file, json_cache=True).get('server.name') == 'edited'
+            
+            # Values JSON cannot round-trip are not cached
+            config_file.write_text('ports:\n  1: http\n')
+            stat = cache_file.stat()
+            os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            assert ConfigManager(config_file, json_cache=True).config == {'ports': {1: 'http'}}
+            assert not cache_file.exists()
+            
+    @pytest.mark.skipif(os.name == 'nt', reason="POSIX file modes only")
+    def test_yaml_json_cache_mode_follows_umask(self, monkeypatch):
+        """Test the JSON cache gets umask-derived permissions."""
+        monkeypatch.setattr(config_manager_module, '_UMASK', 0o022)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_file = Path(temp_dir) / 'config.yaml'
+            config_file.write_text('name: agent\n')
+            
+            ConfigManager(config_file, json_cache=True)
+            cache_file = Path(temp_dir) / 'config.yaml.json'
+            assert cache_file.stat().st_mode & 0o777 == 0o644
 
 
 class TestLogger:
@@ -307,4 +405,365 @@ class TestRateLimiter:
         assert limiter.get_tokens_available() == 3
         
         limiter.acquire(tokens=3, blocking=False)
-        assert limiter.get_tokens_available() == 0
\ No newline at end of file
+        assert limiter.get_tokens_available() == 0
+        
+    def test_batch_acquire(self):
+        """Test admitting several calls at once per key."""
+        for limiter_type in ('token_bucket', 'sliding_window', 'fixed_window'):
+            limiter = MultiKeyRateLimiter(5, 1.0, limiter_type=limiter_type)
+            
+            assert limiter.acquire('a', blocking=False, tokens=3)
+            assert not limiter.acquire('a', blocking=False, tokens=3)
+            assert limiter.acquire('a', blocking=False, tokens=2)
+            assert not limiter.acquire('a', blocking=False)
+            
+            # Other keys are unaffected
+            assert limiter.acquire('b', blocking=False, tokens=5)
+            
+    def test_idle_cleanup(self, monkeypatch):
+        """Test recovered per-key limiters are dropped."""
+        clock = [1000.0]
+        
+        class FakeTime:
+            @staticmethod
+            def monotonic():
+                return clock[0]
+                
+        # Non-blocking acquires only read the clock, so drive it by hand
+        monkeypatch.setattr(rate_limiter_module, 'time', FakeTime)
+        
+        for limiter_type in ('token_bucket', 'sliding_window', 'fixed_window'):
+            limiter = MultiKeyRateLimiter(2, 1.0, limiter_type=limiter_type)
+            
+            assert limiter.acquire('idle', blocking=False)
+            clock[0] += 2.0
+            assert limiter.acquire('busy', blocking=False)
+            
+            # Creating a key after the sweep interval drops the idle one
+            assert 'idle' not in limiter.limiters
+            assert 'busy' in limiter.limiters
+            assert limiter.cleanup_idle() == 0
+            
+            clock[0] += 2.0
+            assert limiter.cleanup_idle() == 1
+            assert limiter.limiters == {}
+            
+    def test_sweep_between_lookup_and_acquire(self):
+        """Test a limiter retired mid-acquire does not grant extra calls."""
+        for limiter_type in ('token_bucket', 'sliding_window', 'fixed_window'):
+            limiter = MultiKeyRateLimiter(2, 1.0, limiter_type=limiter_type)
+            swept = []
+            
+            class SweepOnLookup(dict):
+                def get(self, key, default=None):
+                    found = super().get(key, default)
+                    # Run the sweep right after the lock-free lookup
+                    if found is not None and not swept:
+                        swept.append(limiter.cleanup_idle())
+                    return found
+                    
+            limiter.limiters = SweepOnLookup()
+            limiter.acquire('k', blocking=False, tokens=0)
+            
+            assert limiter.acquire('k', blocking=False, tokens=2)
+            assert swept == [1]
+            assert not limiter.acquire('k', blocking=False)
+            
+    def test_fixed_window(self):
+        """Test fixed window counter resets each window."""
+        limiter = FixedWindowRateLimiter(max_calls=3, time_window=0.1)
+        
+        assert limiter.acquire(blocking=False, tokens=2)
+        assert limiter.acquire(blocking=False)
+        assert not limiter.acquire(blocking=False)
+        assert limiter.get_calls_remaining() == 0
+        
+        time.sleep(0.15)
+        
+        assert limiter.get_calls_remaining() == 3
+        assert limiter.acquire(blocking=False)
+        assert limiter.acquire(blocking=True, timeout=0.5, tokens=3)
+        
+    def test_fixed_window_rejects_invalid_tokens(self):
+        """Test token counts outside 0..max_calls are rejected up front."""
+        limiter = FixedWindowRateLimiter(max_calls=3, time_window=60)
+        
+        with pytest.raises(ValueError):
+            limiter.acquire(tokens=4)
+        with pytest.raises(ValueError):
+            limiter.acquire(tokens=-1)
+            
+        # Rejected requests must not change the window's count
+        assert limiter.get_calls_remaining() == 3
+        
+    @pytest.mark.parametrize('limiter_type', ['token_bucket', 'sliding_window', 'fixed_window'])
+    def test_multi_key_rejects_invalid_tokens(self, limiter_type):
+        """Test every limiter type rejects out-of-range tokens without waiting."""
+        limiter = MultiKeyRateLimiter(2, 60, limiter_type)
+        
+        start = time.monotonic()
+        with pytest.raises(ValueError):
+            limiter.acquire('k', tokens=3, timeout=0.5)
+        with pytest.raises(ValueError):
+            limiter.acquire('k', tokens=-1)
+        assert time.monotonic() - start < 0.5
+        assert 'k' not in limiter.limiters
+        
+    def test_rejects_tokens_over_capacity(self):
+        """Test token bucket and sliding window reject requests over capacity."""
+        with pytest.raises(ValueError):
+            RateLimiter(max_calls=2, time_window=60, burst_capacity=4).acquire(tokens=5)
+        with pytest.raises(ValueError):
+            SlidingWindowRateLimiter(max_calls=2, time_window=60).acquire(tokens=3)
+
+
+class TestSimpleCache:
+    """Test cases for SimpleCache."""
+    
+    def test_stats_track_size(self):
+        """Test memory accounting follows sets, overwrites and removals."""
+        cache = SimpleCache()
+        assert cache.stats() == {'entries': 0, 'memory_usage_bytes': 0}
+        
+        cache.set('a', 'x' * 100)
+        cache.set('b', [1, 2, 3])
+        size = cache.stats()['memory_usage_bytes']
+        assert size > 100
+        
+        # Overwriting replaces rather than adds the old size
+        cache.set('a', 'x' * 100)
+        assert cache.stats() == {'entries': 2, 'memory_usage_bytes': size}
+        
+        cache.delete('a')
+        cache.set('c', 'gone', ttl=-1)
+        assert cache.cleanup_expired() == 1
+        assert 0 < cache.stats()['memory_usage_bytes'] < size
+        
+        cache.clear()
+        assert cache.stats() == {'entries': 0, 'memory_usage_bytes': 0}
+        
+    def test_cleanup_expired(self):
+        """Test cleanup removes only entries whose latest TTL has passed."""
+        cache = SimpleCache()
+        
+        cache.set('expired', 1, ttl=-1)
+        cache.set('renewed', 2, ttl=-1)
+        cache.set('renewed', 2, ttl=60)
+        cache.set('deleted', 3, ttl=-1)
+        cache.delete('deleted')
+        cache.set('live', 4, ttl=60)
+        
+        assert cache.cleanup_expired() == 1
+        assert cache.get('expired') is None
+        assert cache.get('renewed') == 2
+        assert cache.get('live') == 4
+        assert cache.cleanup_expired() == 0
+        
+        # Repeated overwrites do not grow the expiry heap without bound
+        for _ in range(1000):
+            cache.set('live', 4, ttl=60)
+        assert len(cache._expiry) <= 2 * cache.stats()['entries'] + 65
+        
+    def test_get_many(self):
+        """Test batched lookup skips missing and expired keys."""
+        cache = SimpleCache()
+        
+        cache.set('a', 1)
+        cache.set('b', None)
+        cache.set('c', 3, ttl=-1)
+        
+        assert cache.get_many(['a', 'b', 'c', 'missing']) == {'a': 1, 'b': None}
+        assert cache.stats()['entries'] == 2
+
+
+class TestFileCache:
+    """Test cases for FileCache."""
+    
+    def test_set_get_delete(self):
+        """Test basic persistence round trip."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = FileCache(cache_dir=temp_dir)
+            
+            cache.set('key', {'value': [1, 2, 3]})
+            assert cache.get('key') == {'value': [1, 2, 3]}
+            assert len(list(Path(temp_dir).glob('*.cache'))) == 1
+            
+            # A second instance sees the same entry
+            assert FileCache(cache_dir=temp_dir).get('key') == {'value': [1, 2, 3]}
+            
+            assert cache.delete('key')
+            assert cache.get('key') is None
+            assert not cache.delete('key')
+            
+    def test_expiration(self):
+        """Test expired entries are dropped."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = FileCache(cache_dir=temp_dir)
+            
+            cache.set('short', 'value', ttl=-1)
+            cache.set('long', 'value', ttl=60)
+            
+            assert cache.cleanup_expired() == 1
+            assert cache.get('short') is None
+            assert cache.get('long') == 'value'
+            
+    def test_unpicklable_value(self):
+        """Test unpicklable values are skipped without leaving files behind."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = FileCache(cache_dir=temp_dir)
+            
+            cache.set('key', 'original')
+            cache.set('key', lambda: None)
+            
+            assert cache.get('key') == 'original'
+            assert sorted(p.suffix for p in Path(temp_dir).iterdir()) == ['.cache']
+            
+    def test_failed_write_removes_temp_file(self):
+        """Test temp files are cleaned up when a write fails unexpectedly."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = FileCache(cache_dir=temp_dir)
+            
+            # Deep nesting makes pickle raise RecursionError
+            value: list = []
+            for _ in range(100000):
+                value = [value]
+                
+            with pytest.raises(RecursionError):
+                cache.set('key', value)
+                
+            assert list(Path(temp_dir).iterdir()) == []
+            
+    @pytest.mark.skipif(os.name == 'nt', reason="POSIX file modes only")
+    def test_entry_mode_follows_umask(self, monkeypatch):
+        """Test entries get umask-derived permissions rather than mkstemp's 0600."""
+        monkeypatch.setattr(cache_module, '_UMASK', 0o027)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = FileCache(cache_dir=temp_dir)
+            cache.set('key', 'value')
+            
+            entry, = Path(temp_dir).glob('*.cache')
+            assert entry.stat().st_mode & 0o777 == 0o640
+
+
+class TestPerformanceMonitor:
+    """Test cases for PerformanceMonitor."""
+    
+    def test_timing_stats(self):
+        """Test summary statistics over recorded timings."""
+        monitor = PerformanceMonitor()
+        
+        for duration in (0.1, 0.2, 0.3, 0.4):
+            monitor.record_timing('op', duration)
+            
+        stats = monitor.get_timing_stats('op')
+        assert stats['count'] == 4
+        assert stats['min'] == pytest.approx(0.1)
+        assert stats['max'] == pytest.approx(0.4)
+        assert stats['mean'] == pytest.approx(0.25)
+        assert stats['median'] == pytest.approx(0.25)
+        assert monitor.get_timing_stats('missing') is None
+        
+        # Only the most recent 1000 samples are kept
+        for _ in range(1500):
+            monitor.record_timing('op', 1.0)
+        assert monitor.get_timing_stats('op')['min'] == 1.0
+        
+    def test_get_all_stats(self):
+        """Test combined snapshot of timings and counters."""
+        monitor = PerformanceMonitor()
+        
+        @monitor.time_function('work')
+        def work():
+            return 42
+            
+        assert work() == 42
+        monitor.increment_counter('calls', 2)
+        
+        stats = monitor.get_all_stats()
+        assert stats['counters'] == {'calls': 2}
+        assert stats['timings']['work']['count'] == 1
+
+
+class TestSimpleScheduler:
+    """Test cases for SimpleScheduler."""
+    
+    def test_workers_avoid_head_of_line_blocking(self):
+        """Test a blocked task does not stall other tasks when using workers."""
+        scheduler = SimpleScheduler(max_workers=2)
+        release = threading.Event()
+        started = threading.Event()
+        calls = {'slow': 0, 'fast': 0}
+        
+        def slow():
+            calls['slow'] += 1
+            started.set()
+            release.wait(5)
+            
+        def fast():
+            calls['fast'] += 1
+            
+        scheduler.add_task(slow, 0.05)
+        scheduler.add_task(fast, 0.05)
+        scheduler.start()
+        try:
+            assert started.wait(2)
+            time.sleep(0.5)
+            
+            assert calls['fast'] >= 2
+            # Not resubmitted while its previous run is still in progress
+            assert calls['slow'] == 1
+        finally:
+            release.set()
+            scheduler.stop()
+
+
+    def test_stop_shuts_down_workers(self):
+        """Test stop() ends worker threads and start() recreates them."""
+        baseline = threading.active_count()
+        scheduler = SimpleScheduler(max_workers=3)
+        calls = []
+        
+        scheduler.add_task(lambda: calls.append(1), 0.05)
+        
+        for _ in range(2):
+            scheduler.start()
+            assert threading.active_count() == baseline + 4
+            time.sleep(0.3)
+            scheduler.stop()
+            assert threading.active_count() == baseline
+            
+        # Ran in both start/stop cycles
+        assert len(calls) >= 2
+
+
+class TestScheduleEvery:
+    """Test cases for schedule_every decorator."""
+    
+    def test_shared_scheduler(self):
+        """Test decorated functions share one scheduler thread."""
+        calls = {'first': 0, 'second': 0}
+        scheduler = scheduler_module._default_scheduler
+        
+        @schedule_every(0.05)
+        def first():
+            calls['first'] += 1
+            
+        @schedule_every(0.05)
+        def second():
+            calls['second'] += 1
+            
+        try:
+            thread = scheduler.scheduler_thread
+            
+            time.sleep(0.4)
+            
+            assert calls['first'] >= 1
+            assert calls['second'] >= 1
+            assert scheduler.scheduler_thread is thread
+            assert thread.is_alive()
+        finally:
+            # Don't leave the tasks running for the rest of the session
+            for task_id, task in list(scheduler.tasks.items()):
+                if task.func in (first, second):
+                    scheduler.remove_task(task_id)